@@ -4,13 +4,18 @@ from __future__ import annotations
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity import EntityDescription
+from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .api import Check, check_details_url, check_id
+from .api import CompactCheck, check_details_url
 from .const import DOMAIN, LOGGER
 from .coordinator import HealthchecksDataUpdateCoordinator
+from .metrics import HealthchecksMetricsView
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 PLATFORMS = [
     # Platform.BINARY_SENSOR,
@@ -19,6 +24,12 @@ PLATFORMS = [
 ]
 
 
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Healthchecks.io component."""
+    hass.http.register_view(HealthchecksMetricsView(hass))
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Healthchecks.io from a config entry."""
 
@@ -28,6 +39,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
 
     return True
 
@@ -40,6 +52,12 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply updated options to the running coordinator."""
+    coordinator: HealthchecksDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    await coordinator.async_update_options()
+
+
 class HealthchecksEntity(CoordinatorEntity[HealthchecksDataUpdateCoordinator]):
     """Defines a Healthchecks.io base entity."""
 
@@ -49,15 +67,20 @@ class HealthchecksEntity(CoordinatorEntity[HealthchecksDataUpdateCoordinator]):
         self,
         *,
         coordinator: HealthchecksDataUpdateCoordinator,
-        check: Check,
+        check: CompactCheck,
         description: EntityDescription,
     ) -> None:
         """Initialize a Healthchecks.io sensor."""
         super().__init__(coordinator=coordinator)
         self.entity_description = description
-        self._id = check_id(check)
+        self._id = check.id
         self._attr_unique_id = f"{self._id}_{description.key}"
 
+    @property
+    def available(self) -> bool:
+        """Return if the check is still part of the coordinator data."""
+        return super().available and self._id in self.coordinator.data
+
     @property
     def device_info(self) -> DeviceInfo | None:
         """Return the device info."""
@@ -67,7 +90,7 @@ class HealthchecksEntity(CoordinatorEntity[HealthchecksDataUpdateCoordinator]):
             return None
 
         configuration_url: str | None = None
-        if "update_url" in check:
+        if check.writable:
             configuration_url = check_details_url(check)
 
         return DeviceInfo(
@@ -75,5 +98,5 @@ class HealthchecksEntity(CoordinatorEntity[HealthchecksDataUpdateCoordinator]):
             entry_type=DeviceEntryType.SERVICE,
             identifiers={(DOMAIN, self._id)},
             manufacturer="Healthchecks.io",
-            name=check["name"],
+            name=check.name,
         )
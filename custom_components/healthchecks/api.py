@@ -1,5 +1,7 @@
+import sys
+from dataclasses import dataclass
 from typing import Literal, NotRequired, Union, assert_never
-from urllib.parse import urljoin, urlparse, urlunsplit
+from urllib.parse import urljoin
 
 import aiohttp
 import async_timeout
@@ -14,6 +16,8 @@ STATUSES: list[Status] = [
     "paused",
 ]
 
+CHECKS_API_PATH = "/api/v3/checks/"
+
 
 class BaseCheck(TypedDict):
     name: str
@@ -75,27 +79,36 @@ class ListResponse(TypedDict):
     checks: list[Check]
 
 
-class UnauthorizedError(Exception):
-    "The API key is either missing or invalid."
+@dataclass(frozen=True, slots=True)
+class CompactCheck:
+    """Minimal check record kept in memory by the coordinator.
 
+    Only the fields entities read are stored. Repeated strings are interned and
+    read-write URLs are derived from the UUID instead of being stored.
+    """
 
-async def check_api_key(
-    session: aiohttp.ClientSession,
-    api_url: str,
-    api_key: str,
-) -> bool:
-    async with async_timeout.timeout(10):
-        url = urljoin(api_url, "/api/v3/checks/")
-        headers = {"X-Api-Key": api_key}
-        response = await session.request(
-            method="GET",
-            url=url,
-            headers=headers,
-        )
-        if response.status == 401:
-            raise UnauthorizedError()
-        response.raise_for_status()
-        return True
+    id: str
+    name: str
+    status: Status
+    tags: str
+    grace: int
+    n_pings: int
+    last_ping: str | None
+    next_ping: str | None
+    last_duration: int | None
+    timeout: int | None
+    schedule: str | None
+    tz: str | None
+    site_url: str | None
+    ping_base_url: str | None
+
+    @property
+    def writable(self) -> bool:
+        return self.ping_base_url is not None
+
+
+class UnauthorizedError(Exception):
+    "The API key is either missing or invalid."
 
 
 async def list_checks(
@@ -106,7 +119,7 @@ async def list_checks(
     tag: str | None = None,
 ) -> list[Check]:
     async with async_timeout.timeout(10):
-        url = urljoin(api_url, "/api/v3/checks/")
+        url = urljoin(api_url, CHECKS_API_PATH)
 
         headers = {"X-Api-Key": api_key}
 
@@ -149,25 +162,73 @@ def check_uuid(check: BaseReadWriteCheck) -> str:
     return uuid
 
 
-def check_details_url(check: BaseReadWriteCheck) -> str:
-    uri_components = urlparse(check["update_url"])
-    scheme = uri_components.scheme
-    netloc = uri_components.netloc
+def compact_check(
+    check: Check,
+    previous: CompactCheck | None = None,
+) -> CompactCheck:
+    site_url: str | None = None
+    ping_base_url: str | None = None
+    if "ping_url" in check:
+        site_url = sys.intern(check["update_url"].partition(CHECKS_API_PATH)[0])
+        ping_base_url = sys.intern(check["ping_url"][:-36])
+
+    schedule = check.get("schedule")
+    tz = check.get("tz")
+
+    compact = CompactCheck(
+        id=check_id(check),
+        name=check["name"],
+        status=sys.intern(check["status"]),  # type: ignore[arg-type]
+        tags=sys.intern(check["tags"]),
+        grace=check["grace"],
+        n_pings=check["n_pings"],
+        last_ping=check["last_ping"],
+        next_ping=check["next_ping"],
+        last_duration=check.get("last_duration"),
+        timeout=check.get("timeout"),
+        schedule=sys.intern(schedule) if schedule is not None else None,
+        tz=sys.intern(tz) if tz is not None else None,
+        site_url=site_url,
+        ping_base_url=ping_base_url,
+    )
+
+    # Keep the existing record alive rather than the fresh copy so unchanged
+    # checks don't churn memory on every refresh.
+    if previous is not None and previous == compact:
+        return previous
+    return compact
+
+
+def check_ping_url(check: CompactCheck) -> str:
+    assert check.ping_base_url is not None
+    return f"{check.ping_base_url}{check.id}"
+
+
+def check_update_url(check: CompactCheck) -> str:
+    assert check.site_url is not None
+    return f"{check.site_url}{CHECKS_API_PATH}{check.id}"
+
+
+def check_pause_url(check: CompactCheck) -> str:
+    return f"{check_update_url(check)}/pause"
+
+
+def check_resume_url(check: CompactCheck) -> str:
+    return f"{check_update_url(check)}/resume"
 
-    uuid = uri_components.path.split("/")[-1]
-    assert len(uuid) == 36
-    path = f"/checks/{uuid}/details/"
 
-    return urlunsplit((scheme, netloc, path, "", ""))
+def check_details_url(check: CompactCheck) -> str:
+    assert check.site_url is not None
+    return f"{check.site_url}/checks/{check.id}/details/"
 
 
 async def pause_check(
     session: aiohttp.ClientSession,
-    check: ReadWriteCheck,
+    check: CompactCheck,
     api_key: str,
 ) -> None:
     async with async_timeout.timeout(10):
-        url = check["pause_url"]
+        url = check_pause_url(check)
         headers = {"X-Api-Key": api_key}
 
         response = await session.request(
@@ -187,11 +248,11 @@ async def pause_check(
 
 async def resume_check(
     session: aiohttp.ClientSession,
-    check: ReadWriteCheck,
+    check: CompactCheck,
     api_key: str,
 ) -> None:
     async with async_timeout.timeout(10):
-        url = check["resume_url"]
+        url = check_resume_url(check)
         headers = {"X-Api-Key": api_key}
 
         response = await session.request(
@@ -214,12 +275,12 @@ async def resume_check(
 
 async def ping_check(
     session: aiohttp.ClientSession,
-    check: ReadWriteCheck,
+    check: CompactCheck,
 ) -> None:
     async with async_timeout.timeout(10):
         response = await session.request(
             method="GET",
-            url=check["ping_url"],
+            url=check_ping_url(check),
         )
         response.raise_for_status()
         assert response.status == 200
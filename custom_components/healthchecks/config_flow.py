@@ -1,17 +1,28 @@
 """Config flow for Healthchecks.io integration."""
 from __future__ import annotations
 
+import time
 from typing import Any, NotRequired, TypedDict
 
 import voluptuous as vol
-from homeassistant.config_entries import ConfigFlow
-from homeassistant.const import CONF_API_KEY
+from homeassistant.config_entries import ConfigEntry, ConfigFlow, OptionsFlow
+from homeassistant.const import CONF_API_KEY, CONF_SCAN_INTERVAL
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .api import UnauthorizedError, check_api_key
-from .const import CONF_API_URL, CONF_NAME, CONF_SLUG, CONF_TAG, DEFAULT_API_URL, DOMAIN
+from .api import UnauthorizedError, list_checks
+from .const import (
+    CONF_API_URL,
+    CONF_NAME,
+    CONF_SLUG,
+    CONF_TAG,
+    DATA_VALIDATED_CHECKS,
+    DEFAULT_API_URL,
+    DOMAIN,
+    SCAN_INTERVAL,
+)
 
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
@@ -31,11 +42,23 @@ class ConfigEntityData(TypedDict):
     tag: NotRequired[str | None]
 
 
+class ConfigEntityOptions(TypedDict):
+    slug: str | None
+    tag: str | None
+    scan_interval: int
+
+
 class HealthchecksConfigFlow(ConfigFlow, domain=DOMAIN):
     """Config flow for Healthchecks.io."""
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Get the options flow for this handler."""
+        return HealthchecksOptionsFlow(config_entry)
+
     async def async_step_user(
         self,
         user_input: dict[str, Any] | None = None,
@@ -57,12 +80,20 @@ class HealthchecksConfigFlow(ConfigFlow, domain=DOMAIN):
                     data["tag"] = tag
 
                 session = async_get_clientsession(self.hass)
-                await check_api_key(
+                checks = await list_checks(
                     session=session,
                     api_url=data["api_url"],
                     api_key=data["api_key"],
+                    slug=data.get("slug"),
+                    tag=data.get("tag"),
                 )
 
+                # Hand the response to the first coordinator refresh so adding
+                # an entry doesn't download the check list twice.
+                key = (data["api_url"], data["api_key"], slug or None, tag or None)
+                validated = self.hass.data.setdefault(DATA_VALIDATED_CHECKS, {})
+                validated[key] = (time.monotonic(), checks)
+
                 return self.async_create_entry(title=user_input[CONF_NAME], data=data)
             except UnauthorizedError:
                 errors["base"] = "invalid_auth"
@@ -74,3 +105,49 @@ class HealthchecksConfigFlow(ConfigFlow, domain=DOMAIN):
             data_schema=STEP_USER_DATA_SCHEMA,
             errors=errors,
         )
+
+
+class HealthchecksOptionsFlow(OptionsFlow):
+    """Options flow for Healthchecks.io."""
+
+    def __init__(self, config_entry: ConfigEntry) -> None:
+        """Initialize options flow."""
+        self._entry = config_entry
+
+    async def async_step_init(
+        self,
+        user_input: dict[str, Any] | None = None,
+    ) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            options: ConfigEntityOptions = {
+                "slug": user_input.get(CONF_SLUG) or None,
+                "tag": user_input.get(CONF_TAG) or None,
+                "scan_interval": user_input[CONF_SCAN_INTERVAL],
+            }
+            return self.async_create_entry(title="", data=options)
+
+        data = self._entry.data
+        current = self._entry.options
+        slug = current.get(CONF_SLUG, data.get(CONF_SLUG))
+        tag = current.get(CONF_TAG, data.get(CONF_TAG))
+        scan_interval = current.get(
+            CONF_SCAN_INTERVAL, int(SCAN_INTERVAL.total_seconds())
+        )
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_SLUG, description={"suggested_value": slug}
+                    ): cv.string,
+                    vol.Optional(
+                        CONF_TAG, description={"suggested_value": tag}
+                    ): cv.string,
+                    vol.Required(CONF_SCAN_INTERVAL, default=scan_interval): vol.All(
+                        vol.Coerce(int), vol.Range(min=10)
+                    ),
+                }
+            ),
+        )
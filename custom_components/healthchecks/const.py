@@ -16,3 +16,5 @@ CONF_API_URL: Final = "api_url"
 CONF_NAME: Final = "name"
 CONF_TAG: Final = "tag"
 CONF_SLUG: Final = "slug"
+
+DATA_VALIDATED_CHECKS: Final = f"{DOMAIN}_validated_checks"
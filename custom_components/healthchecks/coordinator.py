@@ -1,58 +1,101 @@
 """DataUpdateCoordinator for the Healthchecks.io integration."""
 from __future__ import annotations
 
+import time
+from datetime import timedelta
+
 import aiohttp
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_SCAN_INTERVAL
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .api import (
     Check,
+    CompactCheck,
     UnauthorizedError,
     check_id,
+    compact_check,
     list_checks,
     pause_check,
     ping_check,
     resume_check,
 )
 from .config_flow import ConfigEntityData
-from .const import DOMAIN, LOGGER, SCAN_INTERVAL
+from .const import (
+    CONF_SLUG,
+    CONF_TAG,
+    DATA_VALIDATED_CHECKS,
+    DOMAIN,
+    LOGGER,
+    SCAN_INTERVAL,
+)
 
 
-class HealthchecksDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Check]]):
+class HealthchecksDataUpdateCoordinator(DataUpdateCoordinator[dict[str, CompactCheck]]):
     """The Healthchecks.io Data Update Coordinator."""
 
     session: aiohttp.ClientSession
     config_entry: ConfigEntry
+    refresh_count: int = 0
+    refresh_failures: int = 0
+    last_refresh_duration: float | None = None
 
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry):
         super().__init__(
             hass,
             logger=LOGGER,
             name=DOMAIN,
-            update_interval=SCAN_INTERVAL,
+            update_interval=_update_interval(entry),
         )
         self.config_entry = entry
         self.session = async_get_clientsession(hass)
 
-    async def _async_update_data(self) -> dict[str, Check]:
+    async def async_update_options(self) -> None:
+        """Apply changed entry options without reloading the entry."""
+        self.update_interval = _update_interval(self.config_entry)
+        await self.async_request_refresh()
+
+    async def _async_update_data(self) -> dict[str, CompactCheck]:
+        start = time.monotonic()
+        try:
+            return await self._async_fetch_checks()
+        except Exception:
+            self.refresh_failures += 1
+            raise
+        finally:
+            self.last_refresh_duration = time.monotonic() - start
+            self.refresh_count += 1
+
+    async def _async_fetch_checks(self) -> dict[str, CompactCheck]:
         try:
             data: ConfigEntityData = self.config_entry.data
-            checks = await list_checks(
-                session=self.session,
-                api_url=data["api_url"],
-                api_key=data["api_key"],
-                slug=data.get("slug"),
-                tag=data.get("tag"),
-            )
-            return {check_id(c): c for c in checks}
+            options = self.config_entry.options
+            slug = options.get(CONF_SLUG, data.get("slug"))
+            tag = options.get(CONF_TAG, data.get("tag"))
+
+            checks = _async_pop_validated_checks(self.hass, data, slug, tag)
+            if checks is None:
+                checks = await list_checks(
+                    session=self.session,
+                    api_url=data["api_url"],
+                    api_key=data["api_key"],
+                    slug=slug,
+                    tag=tag,
+                )
+            previous = self.data or {}
+            result: dict[str, CompactCheck] = {}
+            for c in checks:
+                cid = check_id(c)
+                result[cid] = compact_check(c, previous=previous.get(cid))
+            return result
         except UnauthorizedError:
             raise ConfigEntryAuthFailed()
 
-    async def pause_check(self, check: Check) -> None:
-        if "pause_url" not in check:
+    async def pause_check(self, check: CompactCheck) -> None:
+        if not check.writable:
             raise ConfigEntryAuthFailed()
 
         data: ConfigEntityData = self.config_entry.data
@@ -63,8 +106,8 @@ class HealthchecksDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Check]])
         )
         await self.async_refresh()
 
-    async def resume_check(self, check: Check) -> None:
-        if "resume_url" not in check:
+    async def resume_check(self, check: CompactCheck) -> None:
+        if not check.writable:
             raise ConfigEntryAuthFailed()
 
         data: ConfigEntityData = self.config_entry.data
@@ -75,8 +118,8 @@ class HealthchecksDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Check]])
         )
         await self.async_refresh()
 
-    async def ping_check(self, check: Check) -> None:
-        if "ping_url" not in check:
+    async def ping_check(self, check: CompactCheck) -> None:
+        if not check.writable:
             raise ConfigEntryAuthFailed()
 
         await ping_check(
@@ -84,3 +127,30 @@ class HealthchecksDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Check]])
             check=check,
         )
         await self.async_refresh()
+
+
+def _update_interval(entry: ConfigEntry) -> timedelta:
+    if scan_interval := entry.options.get(CONF_SCAN_INTERVAL):
+        return timedelta(seconds=scan_interval)
+    return SCAN_INTERVAL
+
+
+@callback
+def _async_pop_validated_checks(
+    hass: HomeAssistant,
+    data: ConfigEntityData,
+    slug: str | None,
+    tag: str | None,
+) -> list[Check] | None:
+    """Return the check list fetched while validating the entry, if still fresh."""
+    validated: dict[tuple, tuple[float, list[Check]]] = hass.data.get(
+        DATA_VALIDATED_CHECKS, {}
+    )
+    key = (data["api_url"], data["api_key"], slug, tag)
+    if not (entry := validated.pop(key, None)):
+        return None
+
+    fetched_at, checks = entry
+    if time.monotonic() - fetched_at > SCAN_INTERVAL.total_seconds():
+        return None
+    return checks
@@ -1,6 +1,7 @@
 """Diagnostics support for Healthchecks.io."""
 from __future__ import annotations
 
+from dataclasses import asdict
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
@@ -15,4 +16,4 @@ async def async_get_config_entry_diagnostics(
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
     coordinator: HealthchecksDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
-    return list(coordinator.data.values())
+    return [asdict(check) for check in coordinator.data.values()]
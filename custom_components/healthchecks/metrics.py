@@ -0,0 +1,159 @@
+"""OpenMetrics export for the Healthchecks.io integration."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import datetime
+
+from aiohttp import web
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+
+from .api import STATUSES
+from .const import DOMAIN
+from .coordinator import HealthchecksDataUpdateCoordinator
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+
+class HealthchecksMetricsView(HomeAssistantView):
+    """Serve cached check states in OpenMetrics text format."""
+
+    url = "/api/healthchecks/metrics"
+    name = "api:healthchecks:metrics"
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self._cache_key: tuple[tuple[str, int, int], ...] | None = None
+        self._cache = b""
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Return metrics for all loaded config entries."""
+        coordinators: dict[str, HealthchecksDataUpdateCoordinator] = self.hass.data.get(
+            DOMAIN, {}
+        )
+
+        # Output only changes when a coordinator refreshes, so reuse the last
+        # rendering until one of them does. The coordinator identity is part of
+        # the key because a reloaded entry restarts its refresh count.
+        key = tuple(
+            (entry_id, id(coordinator), coordinator.refresh_count)
+            for entry_id, coordinator in coordinators.items()
+        )
+        if key != self._cache_key:
+            self._cache = render_metrics(coordinators.values()).encode()
+            self._cache_key = key
+
+        return web.Response(
+            body=self._cache,
+            headers={"Content-Type": CONTENT_TYPE},
+        )
+
+
+def render_metrics(coordinators: Iterable[HealthchecksDataUpdateCoordinator]) -> str:
+    status: list[str] = []
+    last_ping: list[str] = []
+    last_duration: list[str] = []
+    pings: list[str] = []
+    grace: list[str] = []
+    refresh_duration: list[str] = []
+    refreshes: list[str] = []
+    refresh_failures: list[str] = []
+    refresh_success: list[str] = []
+
+    for coordinator in coordinators:
+        entry = _labels(
+            entry=coordinator.config_entry.entry_id,
+            entry_name=coordinator.config_entry.title,
+        )
+
+        if coordinator.last_refresh_duration is not None:
+            refresh_duration.append(f"{{{entry}}} {coordinator.last_refresh_duration}")
+        refreshes.append(f"_total{{{entry}}} {coordinator.refresh_count}")
+        refresh_failures.append(f"_total{{{entry}}} {coordinator.refresh_failures}")
+        refresh_success.append(f"{{{entry}}} {int(coordinator.last_update_success)}")
+
+        for check in (coordinator.data or {}).values():
+            labels = _labels(
+                entry=coordinator.config_entry.entry_id,
+                entry_name=coordinator.config_entry.title,
+                id=check.id,
+                name=check.name,
+            )
+
+            for value in STATUSES:
+                status.append(
+                    f'{{{labels},healthchecks_check_status="{value}"}} '
+                    f"{int(check.status == value)}"
+                )
+            if check.last_ping is not None:
+                timestamp = datetime.fromisoformat(check.last_ping).timestamp()
+                last_ping.append(f"{{{labels}}} {timestamp}")
+            if check.last_duration is not None:
+                last_duration.append(f"{{{labels}}} {check.last_duration}")
+            pings.append(f"_total{{{labels}}} {check.n_pings}")
+            grace.append(f"{{{labels}}} {check.grace}")
+
+    lines: list[str] = []
+    _family(lines, "healthchecks_check_status", "stateset", "Check status.", status)
+    _family(
+        lines,
+        "healthchecks_check_last_ping_timestamp_seconds",
+        "gauge",
+        "Time of the last ping received.",
+        last_ping,
+    )
+    _family(
+        lines,
+        "healthchecks_check_last_duration_seconds",
+        "gauge",
+        "Duration of the last completed run.",
+        last_duration,
+    )
+    _family(lines, "healthchecks_check_pings", "counter", "Pings received.", pings)
+    _family(lines, "healthchecks_check_grace_seconds", "gauge", "Grace period.", grace)
+    _family(
+        lines,
+        "healthchecks_refresh_duration_seconds",
+        "gauge",
+        "Duration of the last check list refresh.",
+        refresh_duration,
+    )
+    _family(
+        lines, "healthchecks_refreshes", "counter", "Check list refreshes.", refreshes
+    )
+    _family(
+        lines,
+        "healthchecks_refresh_failures",
+        "counter",
+        "Failed check list refreshes.",
+        refresh_failures,
+    )
+    _family(
+        lines,
+        "healthchecks_refresh_success",
+        "gauge",
+        "Whether the last check list refresh succeeded.",
+        refresh_success,
+    )
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+def _family(
+    lines: list[str],
+    name: str,
+    metric_type: str,
+    help_text: str,
+    samples: list[str],
+) -> None:
+    lines.append(f"# TYPE {name} {metric_type}")
+    lines.append(f"# HELP {name} {help_text}")
+    lines.extend(f"{name}{sample}" for sample in samples)
+
+
+def _labels(**labels: str) -> str:
+    return ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
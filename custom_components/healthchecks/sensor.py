@@ -13,12 +13,12 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory, UnitOfTime
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import entity_platform
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import HealthchecksEntity
-from .api import STATUSES, Check
+from .api import STATUSES, CompactCheck
 from .const import DOMAIN, LOGGER
 
 
@@ -33,22 +33,31 @@ async def async_setup_entry(
     platform = entity_platform.async_get_current_platform()
     platform.async_register_entity_service("ping", {}, "ping")
 
-    async_add_entities(
-        HealthchecksSensorEntity(
-            coordinator=coordinator,
-            check=check,
-            description=description,
+    known_ids: set[str] = set()
+
+    @callback
+    def _async_add_new_checks() -> None:
+        checks = [c for c in coordinator.data.values() if c.id not in known_ids]
+        known_ids.update(c.id for c in checks)
+        async_add_entities(
+            HealthchecksSensorEntity(
+                coordinator=coordinator,
+                check=check,
+                description=description,
+            )
+            for check in checks
+            for description in SENSORS
         )
-        for check in coordinator.data.values()
-        for description in SENSORS
-    )
+
+    _async_add_new_checks()
+    entry.async_on_unload(coordinator.async_add_listener(_async_add_new_checks))
 
 
 @dataclass
 class HealthchecksSensorEntityDescriptionMixin:
     """Mixin for required keys."""
 
-    value_fn: Callable[[Check], datetime | int | str | None]
+    value_fn: Callable[[CompactCheck], datetime | int | str | None]
 
 
 @dataclass
@@ -87,21 +96,21 @@ SENSORS: tuple[HealthchecksSensorEntityDescription, ...] = (
         icon="mdi:server",
         device_class=SensorDeviceClass.ENUM,
         options=STATUSES,
-        value_fn=lambda check: check["status"],
+        value_fn=lambda check: check.status,
     ),
     HealthchecksSensorEntityDescription(
         key="timeout",
         translation_key="timeout",
         entity_category=EntityCategory.DIAGNOSTIC,
         native_unit_of_measurement=UnitOfTime.SECONDS,
-        value_fn=lambda check: check.get("timeout"),
+        value_fn=lambda check: check.timeout,
     ),
     HealthchecksSensorEntityDescription(
         key="grace",
         translation_key="grace",
         entity_category=EntityCategory.DIAGNOSTIC,
         native_unit_of_measurement=UnitOfTime.SECONDS,
-        value_fn=lambda check: check["grace"],
+        value_fn=lambda check: check.grace,
     ),
     HealthchecksSensorEntityDescription(
         key="n_pings",
@@ -109,28 +118,28 @@ SENSORS: tuple[HealthchecksSensorEntityDescription, ...] = (
         entity_category=EntityCategory.DIAGNOSTIC,
         native_unit_of_measurement="pings",
         state_class=SensorStateClass.TOTAL_INCREASING,
-        value_fn=lambda check: check["n_pings"],
+        value_fn=lambda check: check.n_pings,
     ),
     HealthchecksSensorEntityDescription(
         key="last_ping",
         translation_key="last_ping",
         device_class=SensorDeviceClass.TIMESTAMP,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda check: _parse_timestamp(check["last_ping"]),
+        value_fn=lambda check: _parse_timestamp(check.last_ping),
     ),
     HealthchecksSensorEntityDescription(
         key="next_ping",
         translation_key="next_ping",
         device_class=SensorDeviceClass.TIMESTAMP,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda check: _parse_timestamp(check["next_ping"]),
+        value_fn=lambda check: _parse_timestamp(check.next_ping),
     ),
     HealthchecksSensorEntityDescription(
         key="last_duration",
         translation_key="last_duration",
         entity_category=EntityCategory.DIAGNOSTIC,
         native_unit_of_measurement=UnitOfTime.SECONDS,
-        value_fn=lambda check: check.get("last_duration"),
+        value_fn=lambda check: check.last_duration,
     ),
 )
 
@@ -8,7 +8,7 @@ from homeassistant.components.switch import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import HealthchecksEntity
@@ -23,17 +23,25 @@ async def async_setup_entry(
     """Set up a Healthchecks.io switch based on a config entry."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
 
-    switches = []
-    for check in coordinator.data.values():
-        if "pause_url" in check:
-            switch = HealthchecksPauseSwitchEntity(
-                coordinator=coordinator,
-                check=check,
-                description=PAUSE_SWITCH,
-            )
-            switches.append(switch)
+    known_ids: set[str] = set()
 
-    async_add_entities(switches)
+    @callback
+    def _async_add_new_checks() -> None:
+        switches = []
+        for check in coordinator.data.values():
+            if check.writable and check.id not in known_ids:
+                known_ids.add(check.id)
+                switch = HealthchecksPauseSwitchEntity(
+                    coordinator=coordinator,
+                    check=check,
+                    description=PAUSE_SWITCH,
+                )
+                switches.append(switch)
+
+        async_add_entities(switches)
+
+    _async_add_new_checks()
+    entry.async_on_unload(coordinator.async_add_listener(_async_add_new_checks))
 
 
 PAUSE_SWITCH = SwitchEntityDescription(
@@ -57,7 +65,7 @@ class HealthchecksPauseSwitchEntity(HealthchecksEntity, SwitchEntity):
         if not check:
             LOGGER.warning("Couldn't load switch for %s", self._id)
             return None
-        return check["status"] == "paused"
+        return check.status == "paused"
 
     async def async_turn_on(self, **kwargs) -> None:
         """Pause check"""